@@ -1,18 +1,21 @@
 """The Jablotron Cloud integration."""
 from __future__ import annotations
 
+import asyncio
 from datetime import timedelta
 import logging
+import time
 
 import async_timeout
 from jablotronpy import Jablotron, UnexpectedResponse
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN, SERVICE_ID, SERVICE_TYPE
+from .const import COMP_ID, DEVICE_ID, DOMAIN, SERVICE_ID, SERVICE_TYPE, UNSUPPORTED_SERVICES
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,6 +28,26 @@ PLATFORMS: list[Platform] = [
 
 ASYNC_TIMEOUT = 120
 
+# Service list changes rarely, refresh it less often than the states
+SERVICES_CACHE_TTL = 3600
+
+UPDATE_INTERVAL = timedelta(seconds=30)
+# Poll less often while nothing changes to spare the cloud API
+IDLE_UPDATE_INTERVAL = UPDATE_INTERVAL * 4
+# Poll more often for a few updates after a user action to catch its result
+BOOSTED_UPDATE_INTERVAL = UPDATE_INTERVAL / 2
+BOOSTED_UPDATES = 2
+
+# Fetch calls raise UnexpectedResponse when the cloud refuses the request, OSError for
+# connection errors of requests and ValueError when the response is not JSON
+FETCH_ERRORS = (UnexpectedResponse, OSError, ValueError)
+# Failing endpoint shows its previous data only for a few updates in a row
+MAX_ENDPOINT_FALLBACKS = 3
+
+# Control calls raise UnexpectedResponse when the cloud does not confirm the new state
+# and AttributeError when the request itself failed and the bridge got no data back
+CONTROL_ERRORS = (UnexpectedResponse, AttributeError)
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Jablotron Cloud from a config entry."""
 
@@ -62,6 +85,39 @@ async def update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     await hass.config_entries.async_reload(entry.entry_id)
 
 
+def _component_state(data: dict, service_id: int, group: str, component_id: str) -> dict | None:
+    """Return state of a gate or section from coordinator data, None when missing."""
+    service_data = data.get(service_id) or {}
+    return (service_data.get(group) or {}).get("states_by_id", {}).get(component_id)
+
+
+def _fetch_service_data(bridge: Jablotron, service_id: int, service_type: str) -> dict:
+    """Fetch gates, sections and thermo devices of a service in one executor job.
+
+    Endpoint failures are returned in place of the data so the caller can report them.
+    """
+    service_data = {}
+    for name, fetch in (
+        ("gates", bridge.get_programmable_gates),
+        ("sections", bridge.get_sections),
+        ("thermo", bridge.get_thermo_devices),
+    ):
+        try:
+            service_data[name] = fetch(service_id, service_type)
+        except FETCH_ERRORS as error:
+            service_data[name] = error
+
+    for name in ("gates", "sections"):
+        components = service_data[name]
+        if isinstance(components, dict):
+            # Index states so every entity can find its own state directly
+            components["states_by_id"] = {
+                state[COMP_ID]: state for state in components.get("states") or []
+            }
+
+    return service_data
+
+
 class JablotronDataCoordinator(DataUpdateCoordinator):
     """Data coordinator around jablotron cloud API."""
 
@@ -71,27 +127,110 @@ class JablotronDataCoordinator(DataUpdateCoordinator):
             hass,
             _LOGGER,
             name="Jablotron Cloud",
-            update_interval=timedelta(seconds=30),
+            update_interval=UPDATE_INTERVAL,
+            # Every update builds fresh dicts, so unchanged data compares equal
+            always_update=False,
         )
         self.bridge = bridge
+        # The bridge is not thread safe and control calls set the PIN on it,
+        # every call on it runs under this lock
+        self.bridge_lock = asyncio.Lock()
         self.is_first_update = True
         self.api_fail_count = 0
+        self._services_cache = None
+        self._services_cache_ts = 0.0
+        self._boosted_updates = 0
+        self._device_infos: dict[int, DeviceInfo] = {}
+        self._endpoint_fallbacks: dict[tuple[int, str], int] = {}
+        self._confirmed_states: list[tuple[int, str, str, str]] = []
 
     async def _recreate_bridge(self):
         # recreate bridge to restart connection until it is fixed on bridge side
         self.bridge = Jablotron(self.bridge.username, self.bridge.password, self.bridge.pin_code)
         _LOGGER.warning("Bridge recreated.")
 
+    def service_device_info(self, service_id: int) -> DeviceInfo:
+        """Return device info shared by all entities of a service."""
+        if service_id not in self._device_infos:
+            service = self.data[service_id]["service"]
+            self._device_infos[service_id] = DeviceInfo(
+                identifiers={
+                    # Serial numbers are unique identifiers within a specific domain
+                    (DOMAIN, str(service_id))
+                },
+                name=service["name"],
+                manufacturer="Jablotron",
+                model=service[SERVICE_TYPE],
+            )
+
+        return self._device_infos[service_id]
+
+    @callback
+    def async_boost_updates(self) -> None:
+        """Poll faster for the next few updates to pick up the result of a user action.
+
+        Takes effect when the next refresh is scheduled, call it before pushing new data.
+        """
+        self._boosted_updates = BOOSTED_UPDATES
+        self.update_interval = BOOSTED_UPDATE_INTERVAL
+
+    def component_state(self, service_id: int, group: str, component_id: str) -> dict | None:
+        """Return the latest state of a gate or section, None when it is missing."""
+        return _component_state(self.data or {}, service_id, group, component_id)
+
+    @callback
+    def async_set_component_state(
+        self, service_id: int, group: str, component_id: str, state: str
+    ) -> None:
+        """Store state confirmed by a control call and notify entities right away."""
+        component_state = self.component_state(service_id, group, component_id)
+        if component_state is None:
+            return
+
+        component_state["state"] = state
+        # An update in progress may have fetched this component before the control call
+        self._confirmed_states.append((service_id, group, component_id, state))
+        self.async_set_updated_data(self.data)
+
+    def _adapt_update_interval(self, data) -> None:
+        """Choose interval of the next update based on recent activity."""
+        if self._boosted_updates > 0:
+            self._boosted_updates -= 1
+            self.update_interval = BOOSTED_UPDATE_INTERVAL
+        elif data == self.data:
+            self.update_interval = IDLE_UPDATE_INTERVAL
+        else:
+            self.update_interval = UPDATE_INTERVAL
+
     async def _async_update_data(self):
+        """Fetch data and choose interval of the next update."""
+        try:
+            data = await self._async_fetch_data()
+        except Exception as error:
+            # Retry a failing cloud at the regular pace, neither boosted nor idle
+            self._boosted_updates = 0
+            self.update_interval = UPDATE_INTERVAL
+            if isinstance(error, asyncio.TimeoutError):
+                # The timed out call keeps running in its executor thread, leave it the old bridge
+                await self._recreate_bridge()
+            raise
+
+        self._adapt_update_interval(data)
+        return data
+
+    async def _async_fetch_data(self):
         """Fetch data from API endpoint.
 
         This is the place to pre-process the data to lookup tables
         so entities can quickly look up their data.
         """
         data = {}
+        self._confirmed_states.clear()
+        # One deadline covers the whole update, service data gets what is left of it
+        deadline = self.hass.loop.time() + ASYNC_TIMEOUT
         # Note: asyncio.TimeoutError and aiohttp.ClientError are already
         # handled by the data update coordinator.
-        async with async_timeout.timeout(ASYNC_TIMEOUT):                        
+        async with async_timeout.timeout_at(deadline), self.bridge_lock:
 
             # API is failing, try to recreate session
             if self.api_fail_count > 0:
@@ -112,67 +251,123 @@ class JablotronDataCoordinator(DataUpdateCoordinator):
                 # session is valid reset fail counter and continue
                 self.api_fail_count = 0
 
-            services = None
-            try:
-                services = await self.hass.async_add_executor_job(
-                    self.bridge.get_services
-                )
-            except UnexpectedResponse as error:
-                self.api_fail_count += 1
-                _LOGGER.debug("Failed to get services!")
-                raise UpdateFailed("Failed to get services!") from error
-
-            if not services:
-                _LOGGER.info("No services discovered for this jablotron account. No entities will be generated.")
-                return data
-
-            for service in services:
-                service_id = service[SERVICE_ID]
-                service_type = service[SERVICE_TYPE]
-
-                _LOGGER.debug("Loading data for service %d", service_id)
-                if service_type == 'LOGBOOK':
-                    _LOGGER.debug("Service type %s not supported. Skipping service %d", service_type, service_id)
-                    continue
-                
-                try:
-                    gates = await self.hass.async_add_executor_job(
-                        self.bridge.get_programmable_gates, service_id, service_type
-                    )
-                except UnexpectedResponse as error:
-                    self.api_fail_count += 1
-                    _LOGGER.debug(f"Failed to get gates data for service {service_id}")
-                    raise UpdateFailed(f"Failed to get gates data for service {service_id}") from error
-            
-                try:
-                    sections = await self.hass.async_add_executor_job(
-                        self.bridge.get_sections, service_id, service_type
-                    )
-                except UnexpectedResponse as error:                    
-                    self.api_fail_count += 1
-                    _LOGGER.debug(f"Failed to get section data for service {service_id}")
-                    raise UpdateFailed(f"Failed to get section data for service {service_id}") from error                                        
-
+            if (
+                self._services_cache is None
+                or time.monotonic() - self._services_cache_ts > SERVICES_CACHE_TTL
+            ):
                 try:
-                    thermo_devices = await self.hass.async_add_executor_job(
-                        self.bridge.get_thermo_devices, service_id, service_type
+                    services = await self.hass.async_add_executor_job(
+                        self.bridge.get_services
                     )
                 except UnexpectedResponse as error:
                     self.api_fail_count += 1
-                    _LOGGER.debug(f"Failed to get thermo data for service {service_id}")
-                    raise UpdateFailed(f"Failed to get thermo data for service {service_id}") from error
+                    self._services_cache = None
+                    _LOGGER.debug("Failed to get services!")
+                    raise UpdateFailed("Failed to get services!") from error
+
+                self._services_cache = []
+                for service in services or []:
+                    service_type = service[SERVICE_TYPE]
+                    if service_type in UNSUPPORTED_SERVICES:
+                        _LOGGER.debug("Service type %s not supported. Skipping service %d", service_type, service[SERVICE_ID])
+                        continue
+
+                    self._services_cache.append(service)
+                self._services_cache_ts = time.monotonic()
+
+                if not self._services_cache:
+                    _LOGGER.info("No services discovered for this jablotron account. No entities will be generated.")
+
+        # Nothing to poll until the cached service list is refreshed
+        services = self._services_cache
+        if not services:
+            return data
 
-                
-                data[service_id] = {}
-                data[service_id]["service"] = service
-                data[service_id]["gates"] = gates
-                data[service_id]["sections"] = sections
-                data[service_id]["thermo"] = thermo_devices
+        # Services share one bridge and are fetched one at a time within the update
+        # deadline, so a slow service does not discard fresh data of the others.
+        timed_out = False
+        fresh_endpoints = 0
+        for service in services:
+            service_id = service[SERVICE_ID]
+            previous_data = (self.data or {}).get(service_id, {})
+
+            service_data = None if timed_out else await self._async_fetch_service(service, deadline)
+            if service_data is None:
+                timed_out = True
+
+            if timed_out:
+                if not previous_data:
+                    raise UpdateFailed(f"Timeout fetching data for service {service_id}")
+                _LOGGER.debug("Timeout fetching data for service %d. Keeping previous data.", service_id)
+                data[service_id] = previous_data
+                continue
+
+            # Failing endpoint keeps its previous data so entities of the other ones stay fresh
+            for name, result in service_data.items():
+                if not isinstance(result, FETCH_ERRORS):
+                    self._endpoint_fallbacks.pop((service_id, name), None)
+                    fresh_endpoints += 1
+                    continue
 
+                self.api_fail_count += 1
+                self._services_cache = None
+                if name not in previous_data:
+                    _LOGGER.debug("Failed to get %s data for service %d", name, service_id)
+                    raise UpdateFailed(f"Failed to get {name} data for service {service_id}") from result
+
+                # Stale alarm states must not look current for long, fail the update instead
+                fallbacks = self._endpoint_fallbacks.get((service_id, name), 0) + 1
+                self._endpoint_fallbacks[(service_id, name)] = fallbacks
+                if fallbacks > MAX_ENDPOINT_FALLBACKS:
+                    raise UpdateFailed(
+                        f"Failed to get {name} data for service {service_id} {fallbacks} times in a row"
+                    ) from result
+
+                _LOGGER.warning(
+                    "Failed to get %s data for service %d (%d/%d). Keeping previous data.",
+                    name, service_id, fallbacks, MAX_ENDPOINT_FALLBACKS,
+                )
+                service_data[name] = previous_data[name]
+
+            service_data["service"] = service
+            # Thermo data is a plain list, index it here so kept previous data is covered too
+            service_data["thermo_by_id"] = {
+                device[DEVICE_ID]: device for device in service_data["thermo"] or []
+            }
+            data[service_id] = service_data
+
+            if self.is_first_update:
+                _LOGGER.debug("Service %d discovered. Data: %s", service_id, service_data)
+            else:
                 _LOGGER.debug("Service %d successfuly updated.", service_id)
-                if self.is_first_update:                    
-                    _LOGGER.debug("Service %d discovered. Data: %s", service_id, str(data[service_id]))
-
-            self.is_first_update = False            
-            return data
 
+        if not fresh_endpoints:
+            raise UpdateFailed("Failed to get data for all services!")
+
+        # Control calls confirmed during this update are newer than data fetched before them
+        for service_id, group, component_id, state in self._confirmed_states:
+            component_state = _component_state(data, service_id, group, component_id)
+            if component_state is not None:
+                component_state["state"] = state
+
+        self.is_first_update = False            
+        return data
+
+    async def _async_fetch_service(self, service: dict, deadline: float) -> dict | None:
+        """Fetch data of one service on the shared bridge, None when the deadline passed."""
+        async with self.bridge_lock:
+            if self.hass.loop.time() >= deadline:
+                return None
+
+            job = self.hass.async_add_executor_job(
+                _fetch_service_data, self.bridge, service[SERVICE_ID], service[SERVICE_TYPE]
+            )
+            done, _ = await asyncio.wait({job}, timeout=deadline - self.hass.loop.time())
+            if not done:
+                # The executor thread cannot be cancelled and may hang on the cloud
+                # for good. Leave it the old bridge so new calls do not share its
+                # headers and session cookie.
+                await self._recreate_bridge()
+                return None
+
+            return job.result()
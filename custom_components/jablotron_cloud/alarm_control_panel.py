@@ -1,6 +1,7 @@
 """Support for Jablotron alarm control panels."""
 from __future__ import annotations
 
+from functools import partial
 import logging
 
 from homeassistant.components.alarm_control_panel import (
@@ -12,20 +13,21 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     STATE_ALARM_ARMED_AWAY,
     STATE_ALARM_ARMED_HOME,
-    STATE_ALARM_ARMING,
     STATE_ALARM_DISARMED,
-    STATE_ALARM_DISARMING,
 )
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from . import JablotronDataCoordinator
+from . import CONTROL_ERRORS, JablotronDataCoordinator
 from .const import COMP_ID, DOMAIN, SERVICE_TYPE, Actions
+from .entity import JablotronEntity
 
 _LOGGER = logging.getLogger(__name__)
 
+FEATURES_ARM = AlarmControlPanelEntityFeature.ARM_AWAY
+FEATURES_PARTIAL_ARM = FEATURES_ARM | AlarmControlPanelEntityFeature.ARM_HOME
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -79,7 +81,7 @@ async def async_setup_entry(
                     )
                 )
 
-    async_add_entities(entities, True)
+    async_add_entities(entities)
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -87,10 +89,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
-class JablotronAlarmControlPanel(
-    CoordinatorEntity[JablotronDataCoordinator],
-    AlarmControlPanelEntity,
-):
+class JablotronAlarmControlPanel(JablotronEntity, AlarmControlPanelEntity):
     """Representation of an Jablotron cloud based alarm panel."""
 
     _attr_has_entity_name = True
@@ -115,81 +114,65 @@ class JablotronAlarmControlPanel(
         self._service_id = service_id
         self._component_id = component_id
         self._can_partial_arm = partial_arm_enabled
-        self._need_authorization = need_authorization
         self._attr_unique_id = f"{service_id} {component_id}"
         self._attr_name = friendly_name        
         self._service_type = self.coordinator.data[service_id]["service"][SERVICE_TYPE]
-
-    @property
-    def code_format(self) -> CodeFormat | None:
-        """Disable code for sections that don't require it."""
-        return CodeFormat.NUMBER if self.code_arm_required else None
-
-    @property
-    def code_arm_required(self) -> bool:
-        """Whether the code is required for arm actions."""
-        return self._need_authorization
-
-    @property
-    def supported_features(self) -> AlarmControlPanelEntityFeature:
-        """Return the list of supported features."""
-        if self._can_partial_arm:
-            return (
-                AlarmControlPanelEntityFeature.ARM_AWAY
-                | AlarmControlPanelEntityFeature.ARM_HOME
+        state = coordinator.component_state(service_id, "sections", component_id)
+        if state:
+            self._attr_state = self._actions_to_state_alarm.get(
+                state["state"], STATE_ALARM_DISARMED
             )
-
-        return AlarmControlPanelEntityFeature.ARM_AWAY
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return the device info."""
-        return DeviceInfo(
-            identifiers={
-                # Serial numbers are unique identifiers within a specific domain
-                (DOMAIN, str(self._service_id))
-            },
-            name=self.coordinator.data[self._service_id]["service"]["name"],
-            manufacturer="Jablotron",
-            model=self.coordinator.data[self._service_id]["service"][SERVICE_TYPE],
+        # Disable code for sections that don't require it
+        self._attr_code_format = CodeFormat.NUMBER if need_authorization else None
+        self._attr_code_arm_required = need_authorization
+        self._attr_supported_features = (
+            FEATURES_PARTIAL_ARM if partial_arm_enabled else FEATURES_ARM
         )
+        self._attr_device_info = coordinator.service_device_info(service_id)
 
-    def alarm_disarm(self, code: str | None = None) -> None:
+    async def async_alarm_disarm(self, code: str | None = None) -> None:
         """Disarm section."""
-        self._setup_pin(code)
+        await self._async_control_section(code, Actions.DISARM)
 
-        self.coordinator.bridge.control_component(
-            self._service_id, self._component_id, Actions.DISARM, self._service_type
-        )
-        self._attr_state = STATE_ALARM_DISARMING
-        self.schedule_update_ha_state()
-
-    def alarm_arm_away(self, code: str | None = None) -> None:
+    async def async_alarm_arm_away(self, code: str | None = None) -> None:
         """Arm section."""
-        self._setup_pin(code)
-
-        self.coordinator.bridge.control_component(
-            self._service_id, self._component_id, Actions.ARM, self._service_type, force=True
-        )
-        self._attr_state = STATE_ALARM_ARMING
-        self.schedule_update_ha_state()
+        await self._async_control_section(code, Actions.ARM, force=True)
 
-    def alarm_arm_home(self, code: str | None = None) -> None:
+    async def async_alarm_arm_home(self, code: str | None = None) -> None:
         """Partial arm section if allowed."""
         if not self._can_partial_arm:
             _LOGGER.error("This action should not be available for this section")
             return
 
-        self._setup_pin(code)
-        self.coordinator.bridge.control_component(
-            self._service_id,
-            self._component_id,
-            Actions.PARTIAL_ARM,
-            self._service_type,
-            force=True
+        await self._async_control_section(code, Actions.PARTIAL_ARM, force=True)
+
+    async def _async_control_section(
+        self, code: str | None, action: Actions, force: bool = False
+    ) -> None:
+        """Send section action to the cloud without blocking the event loop."""
+        async with self.coordinator.bridge_lock:
+            self._setup_pin(code)
+            try:
+                await self.hass.async_add_executor_job(
+                    partial(
+                        self.coordinator.bridge.control_component,
+                        self._service_id,
+                        self._component_id,
+                        action,
+                        service_type=self._service_type,
+                        force=force,
+                    )
+                )
+            except CONTROL_ERRORS as error:
+                raise HomeAssistantError(
+                    f"Failed to {action} section {self._attr_name}"
+                ) from error
+
+        # Cloud confirmed the new state, show it without waiting for the next update
+        self.coordinator.async_boost_updates()
+        self.coordinator.async_set_component_state(
+            self._service_id, "sections", self._component_id, action.value
         )
-        self._attr_state = STATE_ALARM_ARMING
-        self.schedule_update_ha_state()
 
     def _setup_pin(self, code: str | None) -> None:
         self.coordinator.bridge.pin_code = self.code_or_default_code(code)
@@ -201,15 +184,19 @@ class JablotronAlarmControlPanel(
             _LOGGER.error("Invalid section data. Maybe session expired")
             return
 
-        sections_data = self.coordinator.data[self._service_id].get("sections", {})
-        states = sections_data.get("states", [])
-        if not states:
+        state = self.coordinator.component_state(
+            self._service_id, "sections", self._component_id
+        )
+        if not state:
             _LOGGER.warning("States data not found")
             return
 
-        state = next(filter(lambda data: data[COMP_ID] == self._component_id, states))
-        _LOGGER.debug("Updating section state: %s", str(state))
-        self._attr_state = self._actions_to_state_alarm.get(
+        alarm_state = self._actions_to_state_alarm.get(
             state["state"], STATE_ALARM_DISARMED
         )
-        self.schedule_update_ha_state()
+        if not self._state_changed(alarm_state, self._attr_state):
+            return
+
+        _LOGGER.debug("Updating section state: %s", state)
+        self._attr_state = alarm_state
+        self.async_write_ha_state()
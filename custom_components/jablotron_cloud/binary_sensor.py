@@ -6,12 +6,11 @@ import logging
 from homeassistant.components.binary_sensor import BinarySensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import JablotronDataCoordinator
-from .const import COMP_ID, DOMAIN, PG_STATE, PG_STATE_OFF, SERVICE_TYPE
+from .const import COMP_ID, DOMAIN, PG_STATE, PG_STATE_OFF
+from .entity import JablotronEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -53,7 +52,7 @@ async def async_setup_entry(
                 ProgrammableGate(coordinator, service_id, gate_id, gate_friendly_name)
             )
 
-    async_add_entities(entities, True)
+    async_add_entities(entities)
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -61,7 +60,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
-class ProgrammableGate(CoordinatorEntity[JablotronDataCoordinator], BinarySensorEntity):
+class ProgrammableGate(JablotronEntity, BinarySensorEntity):
     """Representation of programmable gate in jablotron system."""
 
     _attr_has_entity_name = True
@@ -79,19 +78,10 @@ class ProgrammableGate(CoordinatorEntity[JablotronDataCoordinator], BinarySensor
         self._gate_id = gate_id
         self._attr_unique_id = f"{service_id} {gate_id}"
         self._attr_name = friendly_name
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return the device info."""
-        return DeviceInfo(
-            identifiers={
-                # Serial numbers are unique identifiers within a specific domain
-                (DOMAIN, str(self._service_id))
-            },
-            name=self.coordinator.data[self._service_id]["service"]["name"],
-            manufacturer="Jablotron",
-            model=self.coordinator.data[self._service_id]["service"][SERVICE_TYPE],
-        )
+        self._attr_device_info = coordinator.service_device_info(service_id)
+        state = coordinator.component_state(service_id, "gates", gate_id)
+        if state:
+            self._attr_is_on = state[PG_STATE] != PG_STATE_OFF
 
     @callback
     def _handle_coordinator_update(self) -> None:
@@ -100,11 +90,14 @@ class ProgrammableGate(CoordinatorEntity[JablotronDataCoordinator], BinarySensor
             _LOGGER.error("Invalid gate data. Maybe session expired")
             return
 
-        gates_data = self.coordinator.data[self._service_id].get("gates", {})
-        states = gates_data.get("states", [])
-        for state in states:
-            if state[COMP_ID] == self._gate_id:
-                _LOGGER.debug("Updating programmable gate with data: %s", str(state))
-                self._attr_is_on = not state[PG_STATE] == PG_STATE_OFF
-                self.async_write_ha_state()
-                return
+        state = self.coordinator.component_state(self._service_id, "gates", self._gate_id)
+        if not state:
+            return
+
+        is_on = state[PG_STATE] != PG_STATE_OFF
+        if not self._state_changed(is_on, self._attr_is_on):
+            return
+
+        _LOGGER.debug("Updating programmable gate with data: %s", state)
+        self._attr_is_on = is_on
+        self.async_write_ha_state()
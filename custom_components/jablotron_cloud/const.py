@@ -7,9 +7,12 @@ DOMAIN = "jablotron_cloud"
 SERVICE_ID = "service-id"
 SERVICE_TYPE = "service-type"
 
+UNSUPPORTED_SERVICES = frozenset({"LOGBOOK"})
+
 COMP_ID = "cloud-component-id"
 DEVICE_ID = "object-device-id"
 PG_STATE = "state"
+PG_STATE_ON = "ON"
 PG_STATE_OFF = "OFF"
 
 
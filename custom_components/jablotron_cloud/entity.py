@@ -0,0 +1,26 @@
+"""Base entity for Jablotron Cloud."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from . import JablotronDataCoordinator
+
+
+class JablotronEntity(CoordinatorEntity[JablotronDataCoordinator]):
+    """Entity updated by the Jablotron data coordinator."""
+
+    _last_available: bool | None = None
+
+    def _state_changed(self, value: Any, current: Any) -> bool:
+        """Return whether the new value or the availability needs a state write.
+
+        Most coordinator updates change nothing, skipping their writes spares
+        the state machine and the event bus.
+        """
+        if value == current and self.available == self._last_available:
+            return False
+
+        self._last_available = self.available
+        return True
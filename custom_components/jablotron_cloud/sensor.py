@@ -11,12 +11,11 @@ from homeassistant.components.sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfTemperature
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import JablotronDataCoordinator
-from .const import DEVICE_ID, DOMAIN, SERVICE_TYPE
+from .const import DEVICE_ID, DOMAIN
+from .entity import JablotronEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -52,7 +51,7 @@ async def async_setup_entry(
                 )
             )
 
-    async_add_entities(entities, True)
+    async_add_entities(entities)
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -60,7 +59,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
-class JablotronSensor(CoordinatorEntity[JablotronDataCoordinator], SensorEntity):
+class JablotronSensor(JablotronEntity, SensorEntity):
     """Representation of Jablotron temperature sensor."""
 
     _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
@@ -79,19 +78,11 @@ class JablotronSensor(CoordinatorEntity[JablotronDataCoordinator], SensorEntity)
         self._device_id = device_id
         self._attr_unique_id = f"{service_id} {device_id}"
         self._attr_name = device_id
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return the device info."""
-        return DeviceInfo(
-            identifiers={
-                # Serial numbers are unique identifiers within a specific domain
-                (DOMAIN, str(self._service_id))
-            },
-            name=self.coordinator.data[self._service_id]["service"]["name"],
-            manufacturer="Jablotron",
-            model=self.coordinator.data[self._service_id]["service"][SERVICE_TYPE],
-        )
+        self._attr_device_info = coordinator.service_device_info(service_id)
+        # Start from the value fetched by the first refresh
+        device = self.coordinator.data[service_id]["thermo_by_id"].get(device_id)
+        if device:
+            self._attr_native_value = float(device["temperature"])
 
     @callback
     def _handle_coordinator_update(self) -> None:
@@ -100,11 +91,14 @@ class JablotronSensor(CoordinatorEntity[JablotronDataCoordinator], SensorEntity)
             _LOGGER.error("Invalid gate data. Maybe session expired")
             return
 
-        thermo_data = self.coordinator.data[self._service_id].get("thermo", {})
-        for device in thermo_data:
-            if device[DEVICE_ID] == self._device_id:
-                _LOGGER.debug("Updating thermo device with data: %s", str(device))
-                temperature = float(device["temperature"])
-                self._attr_native_value = temperature
-                self.async_write_ha_state()
-                return
+        device = self.coordinator.data[self._service_id]["thermo_by_id"].get(self._device_id)
+        if not device:
+            return
+
+        temperature = float(device["temperature"])
+        if not self._state_changed(temperature, self._attr_native_value):
+            return
+
+        _LOGGER.debug("Updating thermo device with data: %s", device)
+        self._attr_native_value = temperature
+        self.async_write_ha_state()
@@ -7,12 +7,12 @@ from typing import Any
 from homeassistant.components.switch import SwitchDeviceClass, SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from . import JablotronDataCoordinator
-from .const import COMP_ID, DOMAIN, PG_STATE, PG_STATE_OFF, SERVICE_TYPE
+from . import CONTROL_ERRORS, JablotronDataCoordinator
+from .const import COMP_ID, DOMAIN, PG_STATE, PG_STATE_OFF, PG_STATE_ON
+from .entity import JablotronEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -54,7 +54,7 @@ async def async_setup_entry(
                 ProgrammableGate(coordinator, service_id, gate_id, gate_friendly_name)
             )
 
-    async_add_entities(entities, True)
+    async_add_entities(entities)
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -62,7 +62,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
-class ProgrammableGate(CoordinatorEntity[JablotronDataCoordinator], SwitchEntity):
+class ProgrammableGate(JablotronEntity, SwitchEntity):
     """Representation of programmable gate in jablotron system."""
 
     _attr_has_entity_name = True
@@ -81,38 +81,41 @@ class ProgrammableGate(CoordinatorEntity[JablotronDataCoordinator], SwitchEntity
         self._gate_id = gate_id
         self._attr_unique_id = f"{service_id} {gate_id}"
         self._attr_name = friendly_name
+        self._attr_device_info = coordinator.service_device_info(service_id)
+        state = coordinator.component_state(service_id, "gates", gate_id)
+        if state:
+            self._attr_is_on = state[PG_STATE] != PG_STATE_OFF
         self._pin = coordinator.bridge.pin_code
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return the device info."""
-        return DeviceInfo(
-            identifiers={
-                # Serial numbers are unique identifiers within a specific domain
-                (DOMAIN, str(self._service_id))
-            },
-            name=self.coordinator.data[self._service_id]["service"]["name"],
-            manufacturer="Jablotron",
-            model=self.coordinator.data[self._service_id]["service"][SERVICE_TYPE],
-        )
-
-    def turn_on(self, **kwargs: Any) -> None:
+    async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the entity on."""
-        bridge = self.coordinator.bridge
-        bridge.pin_code = self._pin
         _LOGGER.debug("Turning on gate: %s using pin", self._gate_id)
-        bridge.control_programmable_gate(self._service_id, self._gate_id, True)
-        self._attr_is_on = True  # assume state
-        self.schedule_update_ha_state()
+        await self._async_control_gate(True)
 
-    def turn_off(self, **kwargs: Any) -> None:
+    async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the entity off."""
-        bridge = self.coordinator.bridge
-        bridge.pin_code = self._pin
         _LOGGER.debug("Turning off gate: %s using pin", self._gate_id)
-        bridge.control_programmable_gate(self._service_id, self._gate_id, False)
-        self._attr_is_on = False  # assume state
-        self.schedule_update_ha_state()
+        await self._async_control_gate(False)
+
+    async def _async_control_gate(self, on: bool) -> None:
+        """Send gate action to the cloud without blocking the event loop."""
+        async with self.coordinator.bridge_lock:
+            bridge = self.coordinator.bridge
+            bridge.pin_code = self._pin
+            try:
+                await self.hass.async_add_executor_job(
+                    bridge.control_programmable_gate, self._service_id, self._gate_id, on
+                )
+            except CONTROL_ERRORS as error:
+                raise HomeAssistantError(
+                    f"Failed to turn {'on' if on else 'off'} gate {self._attr_name}"
+                ) from error
+
+        # Cloud confirmed the new state, show it without waiting for the next update
+        self.coordinator.async_boost_updates()
+        self.coordinator.async_set_component_state(
+            self._service_id, "gates", self._gate_id, PG_STATE_ON if on else PG_STATE_OFF
+        )
 
     @callback
     def _handle_coordinator_update(self) -> None:
@@ -122,11 +125,14 @@ class ProgrammableGate(CoordinatorEntity[JablotronDataCoordinator], SwitchEntity
             _LOGGER.error("Invalid gate data. Maybe session expired")
             return
 
-        gates_data = self.coordinator.data[self._service_id].get("gates", {})
-        states = gates_data.get("states", [])
-        for state in states:
-            if state[COMP_ID] == self._gate_id:
-                _LOGGER.debug("Updating programmable gate with data: %s", str(state))
-                self._attr_is_on = not state[PG_STATE] == PG_STATE_OFF
-                self.async_write_ha_state()
-                return
+        state = self.coordinator.component_state(self._service_id, "gates", self._gate_id)
+        if not state:
+            return
+
+        is_on = state[PG_STATE] != PG_STATE_OFF
+        if not self._state_changed(is_on, self._attr_is_on):
+            return
+
+        _LOGGER.debug("Updating programmable gate with data: %s", state)
+        self._attr_is_on = is_on
+        self.async_write_ha_state()